@@ -1,5 +1,6 @@
 from src.gui.app_gui import start_gui
 from src.backend.config import is_frozen_exe
+import multiprocessing
 import os
 
 if is_frozen_exe():
@@ -11,4 +12,7 @@ def main():
     start_gui()
 
 if __name__ == "__main__":
+    # PDF date extraction may start worker processes; in the one-file exe they
+    # re-launch this executable and must stop here instead of opening the GUI.
+    multiprocessing.freeze_support()
     main()
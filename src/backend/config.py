@@ -1,9 +1,12 @@
 # config.py
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 import os
 import sys
+import threading
 from pathlib import Path
 import re
 import json
@@ -28,6 +31,15 @@ date_patterns = [
     r"\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec|January|February|March|April|June|July|August|September|October|November|December)\s+\d{2,4}\b"
 ]
 
+# strptime formats for matches of the date_patterns entry at the same index,
+# tried after "/" becomes "-" and commas/repeated whitespace are dropped.
+date_formats = [
+    ("%Y-%m-%d",),
+    ("%d-%m-%Y", "%d-%m-%y"),
+    ("%b %d %Y", "%B %d %Y", "%b %d %y", "%B %d %y"),
+    ("%d %b %Y", "%d %B %Y", "%d %b %y", "%d %B %y"),
+]
+
 file_patterns = {
     'invoice': r"^([^\s]+)\s+invoice\s+([^\s]+)\s+(.+)\.pdf$",
     'soa': r"^Statement of Account for- ([A-Za-z0-9]+)\s+(.+?)\s*\.PDF$"
@@ -114,6 +126,9 @@ class SecureConfig:
         self._fernet: Fernet | None = None
         self._key_storage: str | None = None
         self._confirm_insecure_write = confirm_insecure_write
+        # Last config successfully loaded or saved; avoids a read + decrypt per load().
+        self._cached: dict | None = None
+        self._cache_lock = threading.RLock()
         self._log(f"Storage directory: {get_storage_dir()}")
         self._log(f"Config path: {get_encrypted_config_path()}")
         self._log(f"DPAPI enabled: {self._use_dpapi}")
@@ -261,7 +276,17 @@ class SecureConfig:
         return None
 
     def load(self) -> dict:
-        """Decrypt and load the config from config.enc."""
+        """Decrypt and load the config from config.enc (cached after the first successful read)."""
+        with self._cache_lock:
+            if self._cached is None:
+                loaded = self._load_from_disk()
+                if loaded is None:
+                    return {}
+                self._cached = loaded
+            return copy.deepcopy(self._cached)
+
+    def _load_from_disk(self) -> dict | None:
+        """Read and decrypt config.enc; None when it exists but cannot be decrypted or parsed."""
         cfg_file = get_encrypted_config_path()
         if not cfg_file.exists():
             return {}  # no config yet
@@ -276,20 +301,25 @@ class SecureConfig:
                     return json.loads(decrypted.decode("utf-8"))
                 except Exception as exc:
                     self._log(f"Config JSON parse failed after DPAPI decrypt; returning empty config ({exc}).")
-                    return {}
+                    return None
 
         fernet = self._ensure_fernet()
         try:
             decrypted = fernet.decrypt(encrypted)
         except Exception as exc:
             self._log(f"Fernet decryption failed; config may be corrupt or key has changed ({exc}).")
-            return {}
+            return None
 
         self._log(f"Loaded config via Fernet from: {cfg_file}")
         return json.loads(decrypted.decode("utf-8"))
 
     def save(self, config_dict: dict) -> None:
         """Encrypt and save the config as JSON."""
+        with self._cache_lock:
+            self._save_to_disk(config_dict)
+            self._cached = copy.deepcopy(config_dict)
+
+    def _save_to_disk(self, config_dict: dict) -> None:
         json_bytes = json.dumps(config_dict, indent=2).encode("utf-8")
         cfg_file = get_encrypted_config_path()
 
@@ -336,6 +366,18 @@ def get_date_regex() -> list[re.Pattern[str]]:
     """
     return [re.compile(p) for p in date_patterns]
 
+def get_date_formats() -> list[tuple[str, ...]]:
+    """
+    Return the strptime formats paired with each get_date_regex() pattern.
+
+    Patterns without an entry in date_formats get an empty tuple.
+    """
+    return [
+        tuple(date_formats[i]) if i < len(date_formats) else ()
+        for i in range(len(date_patterns))
+    ]
+
+@functools.lru_cache(maxsize=None)
 def get_file_regex( type: str | None = None
 ) -> re.Pattern[str]:
     default = r"^([^\s]+)\.pdf$"
@@ -65,6 +65,19 @@ def get_conn() -> Iterator[sqlite3.Connection]:
         conn.close()
 
 
+@contextmanager
+def _conn_or_new(conn: Optional[sqlite3.Connection]) -> Iterator[sqlite3.Connection]:
+    """
+    Yield ``conn`` when the caller supplies one (its transaction, its commit);
+    otherwise open a connection via get_conn().
+    """
+    if conn is not None:
+        yield conn
+        return
+    with get_conn() as new_conn:
+        yield new_conn
+
+
 def init_db() -> None:
     """
     Create tables if they don't exist.
@@ -127,12 +140,14 @@ def add_or_update_client(
     head_office: str,
     customer_number: str,
     emails: Iterable[Optional[str]],
+    conn: Optional[sqlite3.Connection] = None,
 ) -> None:
     """
     Insert a new client or update an existing client's invoice recipients.
 
     Pass up to five email addresses; only non-null/non-empty values are stored and
-    any remaining slots are set to NULL.
+    any remaining slots are set to NULL. Pass ``conn`` to write inside the
+    caller's transaction.
     """
     email_list = [email for email in emails if email][:5]
     if not email_list:
@@ -144,7 +159,7 @@ def add_or_update_client(
     if len(email_list) < 5:
         email_list.extend([None] * (5 - len(email_list)))
 
-    with get_conn() as conn:
+    with _conn_or_new(conn) as conn:
         conn.execute(
             """
             INSERT INTO clients (
@@ -174,14 +189,15 @@ def add_or_update_soa(
     soa_file_path: str,
     soa_date: Optional[str] = None,
     soa_period_month: Optional[str] = None,
+    conn: Optional[sqlite3.Connection] = None,
 ) -> None:
     """
     Insert or update a Statement of Account entry for the given client.
 
     The referenced client must exist, otherwise the foreign-key constraint on
-    head_office will fail.
+    head_office will fail. Pass ``conn`` to write inside the caller's transaction.
     """
-    with get_conn() as conn:
+    with _conn_or_new(conn) as conn:
         cur = conn.execute(
             "SELECT 1 FROM clients WHERE head_office = ? LIMIT 1;",
             (head_office,),
@@ -215,11 +231,13 @@ def record_invoice(
     inv_file_path: str,
     invoice_date: Optional[str] = None,  # "YYYY-MM-DD"
     period_month: Optional[str] = None,  # "YYYY-MM"
+    conn: Optional[sqlite3.Connection] = None,
 ) -> None:
     """
     Insert a new invoice record if it doesn't already exist (same invoice file path).
+    Pass ``conn`` to write inside the caller's transaction.
     """
-    with get_conn() as conn:
+    with _conn_or_new(conn) as conn:
         conn.execute(
             """
             INSERT OR IGNORE INTO invoices (
@@ -282,6 +300,28 @@ def get_client(
         cur = conn.execute(query, params)
         return cur.fetchall()
 
+def get_clients(
+    head_offices: Optional[list[str]] = None,
+    customer_numbers: Optional[list[str]] = None,
+) -> list[sqlite3.Row]:
+    """
+    Batched get_client: all client rows matching any of the given values, in
+    insertion order. Values are trimmed and compared against trimmed columns.
+    """
+    query = "SELECT * FROM clients WHERE 1=1"
+    params: list[object] = []
+
+    for column, values in (("head_office", head_offices), ("customer_number", customer_numbers)):
+        if values is not None:
+            if not values:
+                return []
+            query += f" AND TRIM({column}) IN ({','.join('?' * len(values))})"
+            params.extend(v.strip() for v in values)
+
+    with get_conn() as conn:
+        cur = conn.execute(query + " ORDER BY id", params)
+        return cur.fetchall()
+
 def get_invoices(
     head_office: Optional[str] = None,
     customer_number: Optional[str] = None,
@@ -328,6 +368,43 @@ def get_invoices(
         cur = conn.execute(query, params)
         return cur.fetchall()
 
+def get_invoices_by(
+    agg: str,
+    values: list[str],
+    period_months: list[str],
+) -> list[sqlite3.Row]:
+    """
+    Batched get_invoices: invoices for every client in ``values`` (matched on
+    the ``agg`` column, as get_invoices does) within ``period_months``.
+
+    Rows are ordered by period month, then insertion order. Each row carries
+    a ``client_key`` column with the matched (trimmed) value for grouping.
+    """
+    if agg not in ("head_office", "customer_number", "ship_name"):
+        raise ValueError(
+            f"agg must be 'head_office', 'customer_number', or 'ship_name', got {agg!r}"
+        )
+    if not values or not period_months:
+        return []
+
+    if agg == "head_office":
+        query = (
+            "SELECT inv.*, c.head_office AS client_key FROM invoices inv"
+            " LEFT JOIN clients c"
+            " ON TRIM(c.customer_number) = TRIM(inv.customer_number)"
+            " WHERE c.head_office"
+        )
+    else:
+        query = f"SELECT inv.*, TRIM(inv.{agg}) AS client_key FROM invoices inv WHERE TRIM(inv.{agg})"
+    query += f" IN ({','.join('?' * len(values))})"
+    query += f" AND inv_period_month IN ({','.join('?' * len(period_months))})"
+    query += " ORDER BY inv_period_month, inv.id"
+    params = [v.strip() for v in values] + list(period_months)
+
+    with get_conn() as conn:
+        cur = conn.execute(query, params)
+        return cur.fetchall()
+
 def get_client_email(
     head_office: Optional[str] = None,
     customer_number: Optional[str] = None
@@ -459,3 +536,18 @@ def get_soa_by_head_office(
     with get_conn() as conn:
         cur = conn.execute(query, params)
         return cur.fetchall()
+
+def get_soa_by_head_offices(head_offices: list[str]) -> list[sqlite3.Row]:
+    """
+    Batched get_soa_by_head_office: SOA rows for any of ``head_offices``, in
+    insertion order.
+    """
+    if not head_offices:
+        return []
+    placeholders = ",".join("?" * len(head_offices))
+    with get_conn() as conn:
+        cur = conn.execute(
+            f"SELECT * FROM soa WHERE TRIM(head_office) IN ({placeholders}) ORDER BY id",
+            [h.strip() for h in head_offices],
+        )
+        return cur.fetchall()
@@ -1,6 +1,8 @@
 
 import logging
+import os
 from pathlib import Path
+from typing import Iterator
 from src.backend.config import (
     get_file_regex
 )
@@ -8,14 +10,113 @@ from src.backend.config import (
 logger = logging.getLogger(__name__)
 from src.backend.db.db_path import get_db_path
 from src.backend.db.db import (
+    get_conn,
     init_db,
     add_or_update_client,
     add_or_update_soa,
     record_invoice,
 )
-from src.backend.utility.extract_pdf_text import extract_pdf_date
+from src.backend.utility.extract_pdf_text import extract_pdf_dates
 from src.backend.utility.read_xlsx import iter_xlsx_rows_as_dicts
 
+# Directory names never descended into; hidden directories (".name") are skipped too.
+_SKIP_DIRS = frozenset({"__pycache__", "node_modules", "$recycle.bin", "system volume information"})
+
+# (file path, rect field) -> (st_mtime_ns, st_size, extracted date). Lives for the
+# process so repeated rebuilds skip re-parsing PDFs that have not changed.
+_pdf_date_cache: dict[tuple[str, str], tuple[int, int, str | None]] = {}
+
+# (source signature, skipped warnings) of the last complete db_mgmt rebuild.
+_last_rebuild: tuple[tuple, list[str]] | None = None
+
+
+def _iter_pdfs(root: Path, prefix: str = "", contains: str = "") -> Iterator[os.DirEntry[str]]:
+    """Yield ``.pdf`` files under ``root`` whose lower-cased name starts with
+    ``prefix`` and includes ``contains`` (equivalent to ``rglob`` of
+    ``{prefix}*{contains}*.pdf`` with ``case_sensitive=False``).
+
+    Walks the tree with ``os.scandir`` so file/dir checks reuse the metadata
+    returned with each directory listing. Like ``Path.rglob``, symlinked
+    directories are not followed and unreadable directories are skipped;
+    hidden directories and those in ``_SKIP_DIRS`` are not descended into.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        dir_name = entry.name
+                        if not dir_name.startswith(".") and dir_name.lower() not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                        continue
+                    # Cheap string tests first; the caller's regex only sees candidates.
+                    name = entry.name.lower()
+                    if (
+                        name.endswith(".pdf")
+                        and name.startswith(prefix)
+                        and contains in name
+                        and entry.is_file()
+                    ):
+                        yield entry
+        except OSError as exc:
+            logger.warning("Could not read directory %s: %s", path, exc)
+
+
+def _posix(path: str) -> str:
+    """Same result as ``Path(path).as_posix()`` for scandir paths, without building a Path."""
+    return path if os.sep == "/" else path.replace(os.sep, "/")
+
+
+def _extract_dates(files: list[os.DirEntry[str]], field: str) -> dict[str, str | None]:
+    """Return ``extract_pdf_date`` for each file, keyed by its stored (POSIX) path.
+
+    Dates are reused from ``_pdf_date_cache`` while a file's mtime and size are
+    unchanged. The remaining files go through ``extract_pdf_dates``, which
+    spreads large batches over worker processes.
+    """
+    dates: dict[str, str | None] = {}
+    pending: list[tuple[str, int, int]] = []
+    for entry in files:
+        file_path = _posix(entry.path)
+        st = entry.stat()
+        cached = _pdf_date_cache.get((file_path, field))
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            dates[file_path] = cached[2]
+        else:
+            pending.append((file_path, st.st_mtime_ns, st.st_size))
+
+    results = extract_pdf_dates([file_path for file_path, _, _ in pending], field)
+
+    for file_path, mtime_ns, size in pending:
+        pdf_date = results[file_path]
+        _pdf_date_cache[(file_path, field)] = (mtime_ns, size, pdf_date)
+        dates[file_path] = pdf_date
+    return dates
+
+
+def _tree_signature(root: Path, prefix: str = "", contains: str = "") -> tuple:
+    """Path, mtime and size of every PDF ``_iter_pdfs`` would yield under ``root``."""
+    files = []
+    for entry in _iter_pdfs(root, prefix=prefix, contains=contains):
+        st = entry.stat()
+        files.append((entry.path, st.st_mtime_ns, st.st_size))
+    return os.fspath(root), frozenset(files)
+
+
+def _source_signature(client_directory: Path, invoice_folder: Path, soa_folder: Path) -> tuple:
+    """Everything a rebuild reads; equal signatures mean the rebuild would be identical."""
+    client_stat = os.stat(client_directory)
+    return (
+        os.fspath(get_db_path()),
+        os.fspath(client_directory),
+        client_stat.st_mtime_ns,
+        client_stat.st_size,
+        _tree_signature(soa_folder, prefix='statement'),
+        _tree_signature(invoice_folder, contains='invoice'),
+    )
+
 
 def scan_clients_and_soa(client_directory: Path, soa_folder: Path) -> list[str]:
     """Rebuild the database from the client list (xlsx) and SOA files.
@@ -23,6 +124,8 @@ def scan_clients_and_soa(client_directory: Path, soa_folder: Path) -> list[str]:
     Drops and recreates the database, then populates the clients and soa tables.
     Returns a list of warning strings for any files that were skipped.
     """
+    global _last_rebuild
+    _last_rebuild = None
     skipped: list[str] = []
     soa_file_regex = get_file_regex('soa')
 
@@ -31,14 +134,20 @@ def scan_clients_and_soa(client_directory: Path, soa_folder: Path) -> list[str]:
         db_path.unlink()
     init_db()
 
+    # Rows are collected first and written in one transaction at the end, so the
+    # rebuild pays for one commit and holds the write lock only while inserting.
+    client_rows = []
     for row in iter_xlsx_rows_as_dicts(client_directory):
         head_office = row.get('Head Office', '')
         customer_number = row.get('Customer Number')
         emails = [row.get(f'emailforinvoice{idx}') for idx in range(1, 6) if row.get(f'emailforinvoice{idx}')]
-        add_or_update_client(head_office, customer_number, emails)
+        client_rows.append((head_office, customer_number, emails))
+
+    soa_files = [(file, soa_file_regex.fullmatch(file.name)) for file in _iter_pdfs(soa_folder, prefix='statement')]
+    soa_dates = _extract_dates([file for file, m in soa_files if m], 'soa_date')
 
-    for file in soa_folder.rglob('Statement*.pdf', case_sensitive=False):
-        m = soa_file_regex.match(file.name)
+    soa_rows = []
+    for file, m in soa_files:
         if not m:
             msg = f"SOA filename did not match expected pattern — skipped: {file.name}"
             logger.warning(msg)
@@ -46,15 +155,21 @@ def scan_clients_and_soa(client_directory: Path, soa_folder: Path) -> list[str]:
             continue
         head_office = m.group(1)
         head_office_name = m.group(2)
-        soa_file_path = file.as_posix()
-        soa_date = extract_pdf_date(soa_file_path, 'soa_date')
+        soa_file_path = _posix(file.path)
+        soa_date = soa_dates[soa_file_path]
         if soa_date is None:
             msg = f"Could not extract date — SOA skipped: {file.name}"
             logger.warning(msg)
             skipped.append(msg)
             continue
         soa_period_month = soa_date.rsplit('-', 1)[0]
-        add_or_update_soa(head_office, head_office_name, soa_file_path, soa_date, soa_period_month)
+        soa_rows.append((head_office, head_office_name, soa_file_path, soa_date, soa_period_month))
+
+    with get_conn() as conn:
+        for client_row in client_rows:
+            add_or_update_client(*client_row, conn=conn)
+        for soa_row in soa_rows:
+            add_or_update_soa(*soa_row, conn=conn)
 
     return skipped
 
@@ -65,25 +180,37 @@ def scan_invoices_db(invoice_folder: Path) -> list[str]:
     Assumes the DB already exists (run scan_clients_and_soa first).
     Returns a list of warning strings for any files that were skipped.
     """
+    global _last_rebuild
+    _last_rebuild = None
     skipped: list[str] = []
     inv_file_regex = get_file_regex('invoice')
 
-    for file in invoice_folder.rglob('*invoice*.pdf', case_sensitive=False):
-        m = inv_file_regex.match(file.name)
-        if not m:
-            continue
+    invoice_files = [
+        (file, m)
+        for file in _iter_pdfs(invoice_folder, contains='invoice')
+        if (m := inv_file_regex.fullmatch(file.name))
+    ]
+    invoice_dates = _extract_dates([file for file, _ in invoice_files], 'inv_date')
+
+    invoice_rows = []
+    for file, m in invoice_files:
         customer_number = m.group(1)
         tax_invoice_no = m.group(2)
         ship_name = m.group(3)
-        inv_file_path = file.as_posix()
-        invoice_date = extract_pdf_date(inv_file_path, field='inv_date')
+        inv_file_path = _posix(file.path)
+        invoice_date = invoice_dates[inv_file_path]
         if invoice_date is None:
             msg = f"Could not extract date — invoice skipped: {file.name}"
             logger.warning(msg)
             skipped.append(msg)
             continue
         inv_period_month = invoice_date.rsplit('-', 1)[0]
-        record_invoice(tax_invoice_no, customer_number, ship_name, inv_file_path, invoice_date, inv_period_month)
+        invoice_rows.append((tax_invoice_no, customer_number, ship_name, inv_file_path, invoice_date, inv_period_month))
+
+    if invoice_rows:
+        with get_conn() as conn:
+            for invoice_row in invoice_rows:
+                record_invoice(*invoice_row, conn=conn)
 
     return skipped
 
@@ -93,7 +220,24 @@ def db_mgmt(client_directory: Path, invoice_folder: Path, soa_folder: Path) -> l
 
     Convenience wrapper that runs scan_clients_and_soa then scan_invoices_db.
     Returns a combined list of skipped-file warnings.
+
+    When the client file, the matching PDFs (path, mtime, size) and the DB path
+    are unchanged since the last rebuild here, and the DB file still exists, the
+    rebuild is skipped and the previous warnings are returned.
     """
+    global _last_rebuild
+    try:
+        signature = _source_signature(client_directory, invoice_folder, soa_folder)
+    except OSError:
+        signature = None  # let the full rebuild report the problem
+
+    last = _last_rebuild
+    if signature is not None and last is not None and last[0] == signature and get_db_path().exists():
+        logger.info("Source files unchanged since the last rebuild; reusing the database.")
+        return list(last[1])
+
     skipped = scan_clients_and_soa(client_directory, soa_folder)
     skipped += scan_invoices_db(invoice_folder)
+    if signature is not None:
+        _last_rebuild = (signature, list(skipped))
     return skipped
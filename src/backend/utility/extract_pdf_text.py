@@ -1,15 +1,25 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+import itertools
 import logging
+import multiprocessing
+import os
 import re
 
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
-from dateutil import parser as dateparser
-import fitz  # PyMuPDF
+# PyMuPDF and dateutil are imported where they are used: importing fitz costs
+# ~150 ms, and this module is loaded at GUI start-up via db_utility.
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF
 
 from src.backend.config import (
+    get_date_formats,
     get_date_regex,
     pdf_rect_settings,
     page_index,
@@ -18,10 +28,16 @@ from src.backend.config import (
 
 PdfBox = Tuple[float, float, float, float]
 
+# Below this many PDFs, starting worker processes (each importing PyMuPDF)
+# costs more than parsing the files in this process.
+_PROCESS_POOL_MIN_FILES = 32
+
 # ---- REGEX ----
 DATE_PATTERNS: List[re.Pattern[str]] = [
     re.compile(p.pattern, p.flags | re.IGNORECASE) for p in get_date_regex()
 ]
+# strptime formats per DATE_PATTERNS index; dateutil is the per-match fallback.
+DATE_FORMATS: List[Tuple[str, ...]] = get_date_formats()
 
 # ------------- HELPERS ------------- #
 
@@ -29,6 +45,8 @@ def _percent_rect_to_points(page: fitz.Page, pct_box: PdfBox) -> fitz.Rect:
     """
         convert percent box to point box
     """
+    import fitz  # PyMuPDF
+
     width, height = page.rect.width, page.rect.height
     x0 = pct_box[0] * width
     y0 = pct_box[1] * height
@@ -71,6 +89,8 @@ def extract_pdf_text(
     Extract text from a configured rectangle, optionally expanding and OCR'ing it.
     The combined text (direct, expanded, OCR) is returned as a newline-joined string.
     """
+    import fitz  # PyMuPDF
+
     doc = fitz.open(pdf_path)
     try:
         page = doc[page_index]
@@ -103,15 +123,36 @@ def extract_pdf_text(
 
 # -------------  EXTRACT DATE ------------- #
 
-def find_date_strings(text: str) -> List[str]:
-    matches: List[str] = []
+def _date_matches(text: str) -> List[Tuple[int, str]]:
+    """(DATE_PATTERNS index, match) pairs in priority order; see find_date_strings."""
     if not text:
-        return matches
-    for pattern in DATE_PATTERNS:
-        matches.extend(m.group(0) for m in pattern.finditer(text))
-    return matches
+        return []
+    return [
+        (rank, m.group(0))
+        for rank, pattern in enumerate(DATE_PATTERNS)
+        for m in pattern.finditer(text)
+    ]
+
+def find_date_strings(text: str) -> List[str]:
+    """
+    Return the matches of each DATE_PATTERNS entry in turn (earlier patterns
+    take priority), in text order within a pattern. Each pattern scans the
+    whole text, so matches of different patterns may overlap.
+    """
+    return [match for _, match in _date_matches(text)]
+
+def _strptime_date(text: str, formats: Tuple[str, ...]) -> Optional[str]:
+    cleaned = " ".join(text.replace(",", " ").split()).replace("/", "-")
+    for fmt in formats:
+        try:
+            return datetime.strptime(cleaned, fmt).date().isoformat()
+        except ValueError:
+            continue
+    return None
 
 def normalize_first_date(dates: List[str]) -> Optional[str]:
+    from dateutil import parser as dateparser
+
     for d in dates:
         try:
             # Adjust dayfirst depending on your format
@@ -121,6 +162,18 @@ def normalize_first_date(dates: List[str]) -> Optional[str]:
             continue
     return None
 
+def _normalize_first_match(matches: List[Tuple[int, str]]) -> Optional[str]:
+    """
+    ISO date of the first parseable match. Each match is tried with its
+    pattern's strptime formats, then with dateutil via normalize_first_date,
+    before moving on to the next match.
+    """
+    for rank, match in matches:
+        iso = _strptime_date(match, DATE_FORMATS[rank]) or normalize_first_date([match])
+        if iso is not None:
+            return iso
+    return None
+
 def extract_pdf_date(
     pdf_path: Path,
     field: str,
@@ -140,5 +193,32 @@ def extract_pdf_date(
         padding=padding,
     )
 
-    candidates = find_date_strings(combined_text)
-    return normalize_first_date(candidates)
+    return _normalize_first_match(_date_matches(combined_text))
+
+def extract_pdf_dates(
+    pdf_paths: Sequence[Union[str, Path]],
+    field: str,
+    max_workers: Optional[int] = None,
+) -> Dict[Union[str, Path], Optional[str]]:
+    """
+    Run extract_pdf_date over many PDFs, keyed by the paths as given.
+
+    Extraction is CPU-bound and holds the GIL, so at least
+    _PROCESS_POOL_MIN_FILES paths are spread over worker processes (up to
+    ``max_workers``, default one per CPU); smaller batches, or
+    ``max_workers=1``, run in this process.
+    """
+    paths = list(pdf_paths)
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1 or len(paths) < _PROCESS_POOL_MIN_FILES:
+        return {path: extract_pdf_date(path, field) for path in paths}
+
+    # spawn, not fork: callers run this on a worker thread of the GUI process.
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        results = pool.map(
+            extract_pdf_date,
+            paths,
+            itertools.repeat(field),
+            chunksize=max(1, len(paths) // (workers * 4)),
+        )
+        return dict(zip(paths, results))
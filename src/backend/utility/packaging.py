@@ -1,12 +1,19 @@
 from pathlib import Path
+import shutil
 import zipfile
 from typing import Iterable
 
+# Copy buffer for stored members; ZipFile.write copies in 8 KiB reads.
+_COPY_BUFSIZE = 1 << 20
+
 
 def collect_files_to_zip(file_paths: Iterable[str | Path], zip_path: str | Path) -> Path:
     """
     Collects the given files into a single zip archive.
 
+    PDFs are stored as-is since their content streams are already compressed,
+    copied through a 1 MiB buffer; any other file is deflated at the fastest level.
+
     Args:
         file_paths: Paths to files that should be zipped.
         zip_path: Destination path for the output zip file.
@@ -20,11 +27,17 @@ def collect_files_to_zip(file_paths: Iterable[str | Path], zip_path: str | Path)
     destination = Path(zip_path)
     destination.parent.mkdir(parents=True, exist_ok=True)
 
-    with zipfile.ZipFile(destination, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+    with zipfile.ZipFile(destination, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
         for file_path in file_paths:
             path_obj = Path(file_path)
             if not path_obj.is_file():
                 raise FileNotFoundError(f"File not found: {path_obj}")
-            archive.write(path_obj, arcname=path_obj.name)
+            if path_obj.suffix.lower() == ".pdf":
+                zinfo = zipfile.ZipInfo.from_file(path_obj, arcname=path_obj.name)
+                zinfo.compress_type = zipfile.ZIP_STORED
+                with path_obj.open("rb") as src, archive.open(zinfo, "w") as dest:
+                    shutil.copyfileobj(src, dest, _COPY_BUFSIZE)
+            else:
+                archive.write(path_obj, arcname=path_obj.name)
 
     return destination
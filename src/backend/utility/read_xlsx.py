@@ -6,23 +6,27 @@ def iter_xlsx_rows_as_dicts(
     sheet_name: Optional[str] = None,
     header_row: int = 1,
 ):
-    wb = load_workbook(filepath, data_only=True)
-    ws = wb[sheet_name] if sheet_name else wb.active
+    # read_only streams rows from the archive instead of building every cell up
+    # front; the workbook keeps the file open until closed.
+    wb = load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name] if sheet_name else wb.active
 
-    header_cells = next(ws.iter_rows(
-        min_row=header_row,
-        max_row=header_row,
-        values_only=True
-    ))
-    headers = [str(h) if h is not None else "" for h in header_cells]
+        header_cells = next(ws.iter_rows(
+            min_row=header_row,
+            max_row=header_row,
+            values_only=True
+        ))
+        headers = [str(h) if h is not None else "" for h in header_cells]
+        width = len(headers)
 
-    for row_cells in ws.iter_rows(
-        min_row=header_row + 1,
-        values_only=True
-    ):
-        if all(cell is None for cell in row_cells):
-            continue
-        yield {
-            headers[i]: row_cells[i]
-            for i in range(len(headers))
-        }
\ No newline at end of file
+        for row_cells in ws.iter_rows(
+            min_row=header_row + 1,
+            max_col=width,
+            values_only=True
+        ):
+            if row_cells.count(None) == len(row_cells):
+                continue
+            yield dict(zip(headers, row_cells))
+    finally:
+        wb.close()
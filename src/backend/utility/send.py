@@ -4,10 +4,14 @@ MS Graph path: nicemail EmailClient handles OAuth token acquisition and sending.
 """
 from __future__ import annotations
 
+import itertools
 import logging
+import os
 import re
 import string
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, List, Optional
@@ -22,11 +26,11 @@ DEFAULT_BODY_TEMPLATE = (
 )
 
 # Matches legacy {key} placeholders so stored configs using the old str.format
-# syntax are transparently converted to ${key} for string.Template.
-_BRACE_VAR = re.compile(r'\{(\w+)\}')
+# syntax are transparently converted to ${key} for string.Template; ${key} itself is left alone.
+_BRACE_VAR = re.compile(r'(?<!\$)\{(\w+)\}')
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientBatch:
     zip_path: Path
     email_list: List[str]
@@ -38,46 +42,51 @@ class ClientBatch:
 # --------------------------------------------------------------------------- #
 
 _EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_ADDR_SPLIT = re.compile(r"\s*[;,]\s*")
 
 
 def normalize_recipients(email_list: list[str]) -> list[str]:
-    """Split semicolon-separated entries, strip whitespace, drop empties and invalid addresses."""
+    """Split ';'- or ','-separated entries, strip whitespace, and drop empties,
+    duplicates and invalid addresses (first occurrence order is kept)."""
+    joined = ";".join(entry for entry in email_list if entry)
     recipients: list[str] = []
-    for entry in email_list:
-        if not entry:
+    for addr in dict.fromkeys(_ADDR_SPLIT.split(joined.strip())):
+        if not addr:
             continue
-        for addr in entry.split(";"):
-            addr = addr.strip()
-            if not addr:
-                continue
-            if not _EMAIL_RE.match(addr):
-                logger.warning("Skipping invalid email address: %r", addr)
-                continue
-            recipients.append(addr)
+        if not _EMAIL_RE.match(addr):
+            logger.warning("Skipping invalid email address: %r", addr)
+            continue
+        recipients.append(addr)
     return recipients
 
 
-def _render_templates(
-    batch: ClientBatch,
+def _template_renderer(
     subject_template: str,
     body_template: str,
     sender_name: str,
     period: str,
-) -> tuple[str, str]:
+) -> Callable[[ClientBatch], tuple[str, str]]:
+    """Prepare the templates once per send and return a per-batch renderer.
+
+    Only ``head_office_name`` varies between batches, so escape handling,
+    legacy ``{key}`` conversion and the period split happen here rather than
+    once per email.
+    """
     try:
         year, month = str(period).split("-", 1)
     except Exception:
         logger.warning("Period %r is not in YYYY-MM format; {month}/{year} will be blank in templates", period)
         month, year = "", ""
 
-    if isinstance(body_template, str):
-        body_template = body_template.replace("\\n", "\n")
-    if isinstance(subject_template, str):
-        subject_template = subject_template.replace("\\n", "\n")
+    def _compile(template: str) -> string.Template:
+        if isinstance(template, str):
+            template = template.replace("\\n", "\n")
+        # Convert legacy {key} → ${key} so stored configs keep working.
+        return string.Template(_BRACE_VAR.sub(r'${\1}', template))
 
+    subject = _compile(subject_template)
+    body = _compile(body_template)
     fmt = {
-        "head_office_name": batch.head_office_name,
-        "contact_name": batch.head_office_name,
         "sender_name": sender_name,
         "month_year": period,
         "period": period,
@@ -85,12 +94,11 @@ def _render_templates(
         "year": year,
     }
 
-    def _render(template: str) -> str:
-        # Convert legacy {key} → ${key} so stored configs keep working.
-        normalised = _BRACE_VAR.sub(r'${\1}', template)
-        return string.Template(normalised).safe_substitute(fmt)
+    def render(batch: ClientBatch) -> tuple[str, str]:
+        batch_fmt = {**fmt, "head_office_name": batch.head_office_name, "contact_name": batch.head_office_name}
+        return subject.safe_substitute(batch_fmt), body.safe_substitute(batch_fmt)
 
-    return _render(subject_template), _render(body_template)
+    return render
 
 
 # --------------------------------------------------------------------------- #
@@ -110,6 +118,9 @@ def send_all_emails(
     reporter_emails: Optional[List[str]] = None,
     show_message: Optional[Callable[[Any], None]] = None,
     passphrase: Optional[str] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    email_client: Optional[Any] = None,
+    concurrency: int = 1,
 ) -> str:
     """Send all batches via MS Graph and return an activity log string.
 
@@ -125,6 +136,11 @@ def send_all_emails(
         reporter_emails:    Recipients for the post-run summary email.
         show_message:       Callback passed to nicemail for device-code flow display.
         passphrase:         nicemail passphrase for its internal credential store.
+        progress_callback:  Called as ``(done, total)`` after each batch is processed.
+        email_client:       Existing client from ``create_graph_client`` to reuse; a new
+                            one is created when omitted.
+        concurrency:        Number of batches sent at once over the shared client. The
+                            first batch is always sent alone so sign-in happens once.
     """
     reporter_emails = reporter_emails or []
 
@@ -138,12 +154,15 @@ def send_all_emails(
     activity: list[str] = []
 
     if dry_run:
-        for batch in batches:
-            subject, body = _render_templates(batch, subject_template, body_template, sender_name, period)
+        render = _template_renderer(subject_template, body_template, sender_name, period)
+        for done, batch in enumerate(batches, start=1):
+            subject, body = render(batch)
             activity.append(
                 f"Would send to {', '.join(batch.email_list)} with attachment {batch.zip_path}\n"
                 f"Subject: {subject}\nBody:\n{body}"
             )
+            if progress_callback is not None:
+                progress_callback(done, len(batches))
         return _build_log(activity, is_dry_run=True)
 
     if not ms_email_address:
@@ -161,6 +180,9 @@ def send_all_emails(
         show_message=show_message,
         passphrase=passphrase,
         activity=activity,
+        progress_callback=progress_callback,
+        client=email_client,
+        concurrency=concurrency,
     )
 
     return _build_log(activity, is_dry_run=False)
@@ -170,6 +192,30 @@ def send_all_emails(
 # Transport implementations                                                    #
 # --------------------------------------------------------------------------- #
 
+def create_graph_client(
+    ms_email_address: str,
+    ms_authority: str = "organizations",
+    ms_client_id: str = "",
+    passphrase: Optional[str] = None,
+) -> Any:
+    """Build a nicemail MS Graph client.
+
+    The client holds the MSAL application and token cache, so callers that send
+    repeatedly in one session should keep and reuse it.
+    """
+    from nicemail import EmailClient
+
+    return EmailClient(
+        backend="ms_graph",
+        msal_config={
+            "email_address": ms_email_address,
+            "client_id": ms_client_id,
+            "authority": ms_authority,
+        },
+        passphrase=passphrase,
+    )
+
+
 def _send_via_graph(
     batches: List[ClientBatch],
     *,
@@ -184,22 +230,17 @@ def _send_via_graph(
     show_message: Optional[Callable[[Any], None]],
     passphrase: Optional[str],
     activity: list[str],
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    client: Optional[Any] = None,
+    concurrency: int = 1,
 ) -> None:
-    from nicemail import EmailClient
-
-    client = EmailClient(
-        backend="ms_graph",
-        msal_config={
-            "email_address": ms_email_address,
-            "client_id": ms_client_id,
-            "authority": ms_authority,
-        },
-        passphrase=passphrase,
-    )
+    if client is None:
+        client = create_graph_client(ms_email_address, ms_authority, ms_client_id, passphrase)
+    render = _template_renderer(subject_template, body_template, sender_name, period)
 
-    for batch in batches:
-        subject, body = _render_templates(batch, subject_template, body_template, sender_name, period)
-        recipients = sorted(set(normalize_recipients(batch.email_list)))
+    def _send_one(batch: ClientBatch) -> str:
+        subject, body = render(batch)
+        recipients = sorted(normalize_recipients(batch.email_list))
         kwargs: dict[str, Any] = {
             "to": recipients,
             "subject": subject,
@@ -210,18 +251,33 @@ def _send_via_graph(
         if show_message is not None:
             kwargs["show_message"] = show_message
         try:
+            # Fail before the Graph round trip rather than mail a missing/empty archive.
+            if os.stat(batch.zip_path).st_size == 0:
+                raise ValueError(f"Attachment is empty: {batch.zip_path}")
             client.send(**kwargs)
-            activity.append(
+            return (
                 f"Sent via MS Auth to {', '.join(batch.email_list)} with attachment {batch.zip_path}\n"
                 f"Subject: {subject}\nBody:\n{body}"
             )
         except Exception as exc:
             logger.error("Failed to send to %s: %s", batch.email_list, exc)
-            activity.append(
+            return (
                 f"FAILED to send to {', '.join(batch.email_list)} with attachment {batch.zip_path}\n"
                 f"Error: {exc}"
             )
 
+    # The first batch goes alone so any device-code sign-in or token fetch
+    # happens once; the rest can then share the client's cached token.
+    parallel = concurrency > 1 and len(batches) > 2
+    with ThreadPoolExecutor(max_workers=concurrency) if parallel else nullcontext() as executor:
+        results = [_send_one(batch) for batch in batches[:1]]
+        rest = executor.map(_send_one, batches[1:]) if parallel else map(_send_one, batches[1:])
+        for done, entry in enumerate(itertools.chain(results, rest), start=1):
+            # map() yields in batch order, so the activity log is unchanged by concurrency.
+            activity.append(entry)
+            if progress_callback is not None:
+                progress_callback(done, len(batches))
+
     if reporter_emails and activity:
         log_text = "\n".join(activity)
         report_kwargs: dict[str, Any] = {
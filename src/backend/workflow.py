@@ -1,25 +1,30 @@
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import os
 from pathlib import Path
 import re
+import sqlite3
 
 logger = logging.getLogger(__name__)
 from src.backend.db.db_path import get_db_path
 from src.backend.db.db import (
-    get_client,
-    get_invoices,
+    get_clients,
+    get_invoices_by,
     get_client_email,
-    get_soa_by_head_office,
+    get_soa_by_head_offices,
     get_all_invoices,
 )
 from src.backend.utility.packaging import collect_files_to_zip
-from src.backend.utility.send import ClientBatch, send_all_emails
+from src.backend.utility.send import ClientBatch, create_graph_client, send_all_emails
 
 
 
 
 
 _VALID_AGG = {"head_office", "customer_number", "ship_name"}
+# Archive writes are disk I/O plus zlib, both of which release the GIL.
+_ZIP_WORKERS = min(8, (os.cpu_count() or 1) * 2)
 
 
 def scan_for_invoices(
@@ -38,33 +43,43 @@ def scan_for_invoices(
     next_period_str = f"{next_year}-{next_month:02d}"
     invoices_to_ship: dict[str, list[dict[str, str | None]]] = {}
 
-    for client in client_list:
+    # One batched query per table instead of four lookups per client; rows are
+    # grouped by the trimmed client key, as the per-client filters matched.
+    keys = {client: client.strip() for client in client_list}
+    invoices_by_key: dict[str, list] = {}
+    for inv in get_invoices_by(agg, list(set(keys.values())), [period_str, next_period_str]):
+        invoices_by_key.setdefault(inv["client_key"], []).append(inv)
+
+    if agg == "ship_name":
+        # Resolve SOA via the customer_number on each ship's first invoice
+        lookup_column = "customer_number"
+        lookup_keys = {
+            key: invoices[0]["customer_number"].strip()
+            for key, invoices in invoices_by_key.items()
+        }
+    else:
+        lookup_column = agg
+        lookup_keys = {key: key for key in keys.values()}
 
-        if agg == "ship_name":
-            invoices = get_invoices(ship_name=client, period_month=period_str)
-            invoices += get_invoices(ship_name=client, period_month=next_period_str)
-            # Resolve SOA via the customer_number on the first invoice
-            head_office = None
-            soa_path = None
-            head_office_name = None
-            if invoices:
-                client_rows = get_client(customer_number=invoices[0]["customer_number"])
-                if client_rows:
-                    head_office = client_rows[0]["head_office"]
-                    soa_rows = get_soa_by_head_office(head_office=head_office)
-                    soa_path = soa_rows[0]["soa_file_path"] if soa_rows else None
-                    head_office_name = soa_rows[0]["head_office_name"] if soa_rows else None
-        else:
-            kwargs = {agg: client}
-            client_rows = get_client(**kwargs)
-            if not client_rows:
+    head_office_by_lookup: dict[str, str] = {}
+    for row in get_clients(**{f"{lookup_column}s": list(set(lookup_keys.values()))}):
+        head_office_by_lookup.setdefault(row[lookup_column].strip(), row["head_office"])
+
+    if agg != "ship_name":
+        for client, key in keys.items():
+            if key not in head_office_by_lookup:
                 raise ValueError(f"Client not found in client list: {client!r}")
-            head_office = client_rows[0]['head_office']
-            soa_rows = get_soa_by_head_office(head_office=head_office)
-            soa_path = soa_rows[0]["soa_file_path"] if soa_rows else None
-            head_office_name = soa_rows[0]["head_office_name"] if soa_rows else None
-            invoices = get_invoices(**{agg: client}, period_month=period_str)
-            invoices += get_invoices(**{agg: client}, period_month=next_period_str)
+
+    soa_by_head_office: dict[str, sqlite3.Row] = {}
+    for row in get_soa_by_head_offices(list(set(head_office_by_lookup.values()))):
+        soa_by_head_office.setdefault(row["head_office"].strip(), row)
+
+    for client, key in keys.items():
+        invoices = invoices_by_key.get(key, [])
+        head_office = head_office_by_lookup.get(lookup_keys.get(key, ""))
+        soa_row = soa_by_head_office.get(head_office.strip()) if head_office else None
+        soa_path = soa_row["soa_file_path"] if soa_row else None
+        head_office_name = soa_row["head_office_name"] if soa_row else None
 
         invoices_to_ship[client] = [
             {
@@ -111,10 +126,20 @@ def prep_invoice_zips(
     zip_output_dir: Path | str | None = None,
     agg: str = "head_office",
 ):
-    email_shipment = []
     base_zip_dir = Path(zip_output_dir) if zip_output_dir else get_db_path().parent
     base_zip_dir.mkdir(parents=True, exist_ok=True)
     used_stems: set[str] = set()
+    # Ship-name groups often share a customer number; look each recipient list up once.
+    email_lists: dict[tuple[str, str], list[str]] = {}
+
+    def _emails_for(column: str, value: str) -> list[str]:
+        key = (column, value)
+        if key not in email_lists:
+            email_lists[key] = get_client_email(**{column: value})
+        return email_lists[key]
+
+    # (files, zip destination, shipment without zip_path), in client order.
+    jobs: list[tuple[list, Path, dict]] = []
 
     for client_key, invoices in invoices_to_ship.items():
         if not invoices:
@@ -135,6 +160,7 @@ def prep_invoice_zips(
         if not files_to_zip_paths:
             continue
 
+        # Stems are claimed here, in client order, so collision suffixes stay deterministic.
         safe_stem = re.sub(r'[<>:"/\\|?*]+', "_", client_key).strip().strip(".")
         if safe_stem in used_stems:
             counter = 2
@@ -144,22 +170,38 @@ def prep_invoice_zips(
             logger.warning("ZIP filename collision for %r — writing as %s.zip", client_key, safe_stem)
         used_stems.add(safe_stem)
 
-        zip_path = collect_files_to_zip(files_to_zip_paths, base_zip_dir / f"{safe_stem}.zip")
-
         if agg == "ship_name":
             customer_number = invoices[0].get("customer_number") if invoices else None
-            email_list = get_client_email(customer_number=customer_number) if customer_number else []
+            email_list = _emails_for("customer_number", customer_number) if customer_number else []
         else:
-            email_list = get_client_email(**{agg: client_key})
-        email_shipment.append(
-            {
-                "zip_path": zip_path,
-                "email_list": email_list,
-                "head_office_name": head_office_name,
-            }
+            email_list = _emails_for(agg, client_key)
+        jobs.append(
+            (
+                files_to_zip_paths,
+                base_zip_dir / f"{safe_stem}.zip",
+                {"email_list": email_list, "head_office_name": head_office_name},
+            )
         )
 
-    return email_shipment
+    if not jobs:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(_ZIP_WORKERS, len(jobs))) as executor:
+        zip_paths = list(executor.map(lambda job: collect_files_to_zip(job[0], job[1]), jobs))
+
+    return [
+        {"zip_path": zip_path, **shipment}
+        for zip_path, (_, _, shipment) in zip(zip_paths, jobs)
+    ]
+
+def create_email_client(ms_auth_config, passphrase=None):
+    """Build a reusable MS Graph client from the ``ms_auth_config`` settings dict."""
+    return create_graph_client(
+        ms_auth_config.get('ms_email_address', ""),
+        ms_authority=ms_auth_config.get('ms_authority', "organizations"),
+        ms_client_id=ms_auth_config.get('ms_client_id', ""),
+        passphrase=passphrase,
+    )
 
 def prep_and_send_emails(
     ms_auth_config,
@@ -169,6 +211,9 @@ def prep_and_send_emails(
     dry_run: bool = False,
     show_message=None,
     passphrase=None,
+    progress_callback=None,
+    email_client_factory=None,
+    concurrency: int = 1,
 ):
     client_batches = [ClientBatch(
         zip_path=Path(es.get("zip_path")),
@@ -176,6 +221,10 @@ def prep_and_send_emails(
         head_office_name=es.get("head_office_name"),
     ) for es in email_shipment]
 
+    email_client = None
+    if email_client_factory is not None and not dry_run and ms_auth_config and ms_auth_config.get('ms_email_address'):
+        email_client = email_client_factory(ms_auth_config, passphrase)
+
     email_report = send_all_emails(
         client_batches,
         ms_email_address=ms_auth_config.get('ms_email_address', "") if ms_auth_config else "",
@@ -189,5 +238,8 @@ def prep_and_send_emails(
         reporter_emails=email_setup.get('reporter_emails', []),
         show_message=show_message,
         passphrase=passphrase,
+        progress_callback=progress_callback,
+        email_client=email_client,
+        concurrency=concurrency,
     )
     return email_report
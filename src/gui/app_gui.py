@@ -140,6 +140,7 @@ class InvoiceMailerGUI(SettingsTab, EmailSettingsTab, ScanTab, ZipTab, SendTab):
             "dry_run": mode == "Test",
             "show_message": self._show_device_flow_popup,
             "passphrase": None,
+            "email_client_factory": self._get_email_client,
         }
 
     def _show_device_flow_popup(self, message: object) -> None:
@@ -9,6 +9,7 @@ import traceback
 from src.backend.db.db import get_client_soa_summary, get_clients_by_head_offices
 from src.backend.workflow import scan_for_invoices, get_excluded_invoices
 from src.backend.db.db_utility import scan_clients_and_soa, scan_invoices_db
+from src.gui.utility import single_flight
 
 _CHECK = "☑"
 _UNCHECK = "☐"
@@ -175,8 +176,8 @@ class ScanTab:
     #  Stage 1 — Scan Clients & SOA                                       #
     # ------------------------------------------------------------------ #
 
+    @single_flight("scan_clients_button")
     def start_scan_clients(self):
-        self.scan_clients_button.state(["disabled"])
         self.scan_invoices_button.state(["disabled"])
         self.generate_zip_button.state(["disabled"])
         self.start_send_button.state(["disabled"])
@@ -224,9 +225,9 @@ class ScanTab:
     #  Stage 2 — Scan Invoices                                            #
     # ------------------------------------------------------------------ #
 
+    @single_flight("scan_invoices_button")
     def start_scan_invoices(self):
         self.scan_clients_button.state(["disabled"])
-        self.scan_invoices_button.state(["disabled"])
         self._invoice_checked.clear()
         self.scan_report_var.set("Scanning invoices...")
         threading.Thread(target=self._scan_invoices_thread, daemon=True).start()
@@ -7,12 +7,24 @@ import traceback
 
 from src.backend.db.db import get_client_list
 from src.backend.workflow import (
+    create_email_client,
     prep_and_send_emails,
     prep_invoice_zips,
     #run_workflow,
     scan_for_invoices,
 )
 from src.backend.db.db_utility import db_mgmt
+from src.gui.utility import EMAIL_CLIENT_POOL, single_flight
+
+# Repaint the progress bar at most 10 times per second while a send is running.
+_PROGRESS_INTERVAL_MS = 100
+
+# Banner text and colour per mode; anything that is not "active" is a dry run.
+_MODE_DISPLAY = {
+    "active": ("Active - Emails will send", "red"),
+    "test": ("Test - Dry run (no emails sent)", "blue"),
+}
+
 
 class SendTab:
     """
@@ -20,6 +32,8 @@ class SendTab:
     Expects the consumer to define:
     - self.tab_send (ttk.Frame container)
     - self.root (tk.Tk)
+    - self.settings (dict)
+    - self.mode_var (tk.StringVar, created by SettingsTab before this tab is built)
     - self._build_workflow_kwargs() -> dict
     - self.email_shipment (list) to reuse generated shipments
     """
@@ -28,6 +42,8 @@ class SendTab:
         frame = ttk.LabelFrame(self.tab_send, text="Send Emails")
         frame.pack(fill="both", expand=True, padx=10, pady=10)
 
+        self.tab_send.bind("<Destroy>", lambda _e: EMAIL_CLIENT_POOL.clear(), add="+")
+
         self.send_mode_label_var = tk.StringVar()
         self.send_mode_label = tk.Label(
             frame,
@@ -36,8 +52,7 @@ class SendTab:
         )
         self.send_mode_label.pack(pady=(0, 5))
         self.update_send_mode_display()
-        if hasattr(self, "mode_var"):
-            self.mode_var.trace_add("write", lambda *_: self.update_send_mode_display())
+        self.mode_var.trace_add("write", lambda *_: self.update_send_mode_display())
 
         buttons = ttk.Frame(frame)
         buttons.pack(pady=10)
@@ -51,19 +66,27 @@ class SendTab:
 
         self.progress = ttk.Progressbar(frame, length=300)
         self.progress.pack(pady=10)
+        self._prog_target = 0.0
+        self._prog_painted = 0.0
+        self._prog_pumping = False
 
         self.log_box = tk.Text(frame, height=20, width=80)
         self.log_box.pack(fill="both", expand=True, pady=10)
 
+    @single_flight("start_send_button")
     def start_send(self):
         try:
             # Validate required settings before launching the worker thread.
             self._build_workflow_kwargs()
         except ValueError as exc:
+            self.start_send_button.state(["!disabled"])
             messagebox.showerror("Missing Settings", str(exc))
             return
-        self.start_send_button.state(["disabled"])
         self.progress["value"] = 0
+        self._prog_target = 0.0
+        self._prog_painted = 0.0
+        self._prog_pumping = True
+        self.root.after(_PROGRESS_INTERVAL_MS, self._pump_progress)
         threading.Thread(target=self._send_thread, daemon=True).start()
 
     def clear_send_log(self):
@@ -116,6 +139,8 @@ class SendTab:
                 dry_run=dry_run,
                 show_message=workflow_kwargs.get("show_message"),
                 passphrase=workflow_kwargs.get("passphrase"),
+                progress_callback=lambda done, total: self._update_progress(done / total * 100),
+                email_client_factory=workflow_kwargs.get("email_client_factory"),
             )
             self.root.after(0, lambda: self._on_send_complete(email_report))
         except Exception as exc:  # noqa: BLE001
@@ -123,11 +148,36 @@ class SendTab:
             err_trace = traceback.format_exc()
             self.root.after(0, lambda e=err, tb=err_trace: self._on_send_error(e, tb))
 
+    def _get_email_client(self, ms_auth_config: dict, passphrase: str | None = None):
+        key = (
+            ms_auth_config.get("ms_email_address"),
+            ms_auth_config.get("ms_authority"),
+            ms_auth_config.get("ms_client_id"),
+            passphrase,
+        )
+        return EMAIL_CLIENT_POOL.acquire(
+            key, lambda: create_email_client(ms_auth_config, passphrase=passphrase)
+        )
+
+    def _update_progress(self, value: float) -> None:
+        # Called from the worker thread; only records the target so bursts of
+        # completed batches collapse into a single repaint.
+        self._prog_target = value
+
+    def _pump_progress(self):
+        if not self._prog_pumping:
+            return
+        if self._prog_target != self._prog_painted:
+            self.progress["value"] = self._prog_target
+            self._prog_painted = self._prog_target
+        self.root.after(_PROGRESS_INTERVAL_MS, self._pump_progress)
+
     def log(self, msg):
         self.log_box.insert("end", msg + "\n")
         self.log_box.see("end")
 
     def _on_send_complete(self, email_report):
+        self._prog_pumping = False
         self.progress["value"] = 100
         self.start_send_button.state(["!disabled"])
         self.log("Email send finished.")
@@ -135,6 +185,7 @@ class SendTab:
             self.log(str(email_report))
 
     def _on_send_error(self, exc: Exception, tb: str | None = None):
+        self._prog_pumping = False
         self.start_send_button.state(["!disabled"])
         self.progress["value"] = 0
         if tb:
@@ -157,17 +208,8 @@ class SendTab:
     #        messagebox.showerror("Workflow Failed", str(exc))
 
     def update_send_mode_display(self):
-        mode = getattr(self, "mode_var", None).get() if hasattr(self, "mode_var") else None
-        if not mode:
-            mode = getattr(self, "settings", {}).get("mode")
-        mode = (mode or "Active").strip()
-        if mode.lower() == "active":
-            text = "Active - Emails will send"
-            color = "red"
-        else:
-            text = "Test - Dry run (no emails sent)"
-            color = "blue"
-        if hasattr(self, "send_mode_label_var"):
-            self.send_mode_label_var.set(text)
-        if hasattr(self, "send_mode_label"):
-            self.send_mode_label.config(fg=color)
+        mode = self.mode_var.get() or self.settings.get("mode")
+        mode = (mode or "Active").strip().lower()
+        text, color = _MODE_DISPLAY.get(mode, _MODE_DISPLAY["test"])
+        self.send_mode_label_var.set(text)
+        self.send_mode_label.config(fg=color)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import os
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
-from src.gui.utility import apply_settings_to_vars, settings_from_vars
+from src.gui.utility import apply_settings_to_vars, settings_from_vars, tcl_set_script
 
 
 class SettingsTab:
@@ -20,6 +21,9 @@ class SettingsTab:
         container = ttk.Frame(self.tab_settings)
         container.pack(fill="both", expand=True, padx=10, pady=10)
 
+        # Last directory picked per browse button, so dialogs reopen where the user left off.
+        self._last_dirs: dict[str, str] = {}
+
         frame = ttk.LabelFrame(container, text="Configuration")
         frame.pack(fill="x", padx=5, pady=(0, 10))
 
@@ -73,6 +77,10 @@ class SettingsTab:
             "ms_client_id": self.ms_client_id_var,
         }
         apply_settings_to_vars(self._settings_vars, self.settings)
+        # Keys written since the summary last read them; everything starts dirty.
+        self._dirty_keys: set[str] = set(self._settings_vars)
+        for key, var in self._settings_vars.items():
+            var.trace_add("write", lambda *_, k=key: self._dirty_keys.add(k))
         self.ms_authority_var.trace_add("write", self._handle_ms_authority_change)
 
         self.auth_content = ttk.Frame(container)
@@ -135,60 +143,98 @@ class SettingsTab:
         ttk.Label(self.ms_summary, textvariable=self.ms_authority_label_var).grid(row=1, column=0, sticky="w", pady=2)
         ttk.Label(self.ms_summary, textvariable=self.ms_client_id_label_var).grid(row=2, column=0, sticky="w", pady=2)
 
+        self._last_label_values: dict[str, str] = {}
         self.update_current_settings_display()
 
     def _refresh_auth_frames(self, *_):
-        self.ms_auth_frame.pack(fill="x")
+        if not self.ms_auth_frame.winfo_manager():
+            self.ms_auth_frame.pack(fill="x")
         if hasattr(self, "ms_summary"):
             self._refresh_current_summary_frames()
 
+    def _initial_dir_for(self, kind: str, var: tk.StringVar) -> str:
+        current = var.get().strip()
+        if kind == "client":
+            current = os.path.dirname(current)
+        return self._last_dirs.get(kind) or current or os.path.expanduser("~")
+
     def pick_invoice_folder(self):
-        folder = filedialog.askdirectory()
+        folder = filedialog.askdirectory(initialdir=self._initial_dir_for("invoice", self.invoice_folder_var))
         if folder:
+            self._last_dirs["invoice"] = folder
             self.invoice_folder_var.set(folder)
 
     def pick_output_folder(self):
-        folder = filedialog.askdirectory()
+        folder = filedialog.askdirectory(initialdir=self._initial_dir_for("output", self.output_folder_var))
         if folder:
+            self._last_dirs["output"] = folder
             self.output_folder_var.set(folder)
 
     def pick_soa_folder(self):
-        folder = filedialog.askdirectory()
+        folder = filedialog.askdirectory(initialdir=self._initial_dir_for("soa", self.soa_folder_var))
         if folder:
+            self._last_dirs["soa"] = folder
             self.soa_folder_var.set(folder)
 
     def pick_client_file(self):
-        file_path = filedialog.askopenfilename(filetypes=[("Excel/CSV", "*.xlsx *.csv"), ("All files", "*.*")])
+        file_path = filedialog.askopenfilename(
+            initialdir=self._initial_dir_for("client", self.client_file_var),
+            filetypes=[("Excel/CSV", "*.xlsx *.csv"), ("All files", "*.*")],
+        )
         if file_path:
+            self._last_dirs["client"] = os.path.dirname(file_path)
             self.client_file_var.set(file_path)
 
     def save_settings(self):
         raise NotImplementedError("save_settings should be implemented by the parent class.")
 
     def update_current_settings_display(self):
-        # Merge the current tab values into the existing settings so we don't
+        # Nothing written since the last refresh: the labels are already current.
+        if not self._dirty_keys:
+            return
+
+        # Merge the changed tab values into the existing settings so we don't
         # clobber email-related defaults before the Email tab is built.
-        base_settings = settings_from_vars(self._settings_vars)
+        base_settings = settings_from_vars(self._settings_vars, keys=self._dirty_keys)
+        self._dirty_keys.clear()
         self.settings = {**getattr(self, "settings", {}), **base_settings}
 
-        self.invoice_folder_label_var.set(f"Invoice Folder: {self.settings['invoice_folder'] or '(empty)'}")
-        self.soa_folder_label_var.set(f"SOA Folder: {self.settings['soa_folder'] or '(empty)'}")
-        self.output_folder_label_var.set(f"ZIP Output Folder: {self.settings['output_folder'] or '(empty)'}")
-        self.client_file_label_var.set(f"Client List File: {self.settings['client_file'] or '(empty)'}")
-        self.aggregate_by_label_var.set(f"Aggregate By: {self.settings['aggregate_by'].replace('_',' ').title() or '(empty)'}")
-        self.mode_label_var.set(f"Mode: {self.settings['mode'] or '(empty)'}")
-        self.ms_email_address_label_var.set(f"MS Email Address: {self.settings.get('ms_email_address') or '(empty)'}")
-        self.ms_authority_label_var.set(f"MS Authority: {self.settings.get('ms_authority') or '(empty)'}")
-        self.ms_client_id_label_var.set(f"Azure Client ID: {self.settings.get('ms_client_id') or '(empty)'}")
-        self._refresh_current_summary_frames()
+        self._batch_set({
+            self.invoice_folder_label_var: f"Invoice Folder: {self.settings['invoice_folder'] or '(empty)'}",
+            self.soa_folder_label_var: f"SOA Folder: {self.settings['soa_folder'] or '(empty)'}",
+            self.output_folder_label_var: f"ZIP Output Folder: {self.settings['output_folder'] or '(empty)'}",
+            self.client_file_label_var: f"Client List File: {self.settings['client_file'] or '(empty)'}",
+            self.aggregate_by_label_var: f"Aggregate By: {self.settings['aggregate_by'].replace('_',' ').title() or '(empty)'}",
+            self.mode_label_var: f"Mode: {self.settings['mode'] or '(empty)'}",
+            self.ms_email_address_label_var: f"MS Email Address: {self.settings.get('ms_email_address') or '(empty)'}",
+            self.ms_authority_label_var: f"MS Authority: {self.settings.get('ms_authority') or '(empty)'}",
+            self.ms_client_id_label_var: f"Azure Client ID: {self.settings.get('ms_client_id') or '(empty)'}",
+        })
+
+    def _batch_set(self, mapping: dict[tk.Variable, str]) -> None:
+        # One Tcl eval for the label variables whose text actually changed, so
+        # unchanged labels do not re-fire their traces and redraws.
+        changed = {
+            str(var): value
+            for var, value in mapping.items()
+            if self._last_label_values.get(str(var)) != value
+        }
+        if not changed:
+            return
+        self._last_label_values.update(changed)
+        self.root.tk.eval(tcl_set_script(changed))
 
     def _refresh_current_summary_frames(self):
-        self.ms_summary.grid(row=0, column=1, sticky="nsew", padx=(10, 0))
+        # The summary frame stays gridded once placed; re-gridding it only costs a geometry pass.
+        if not self.ms_summary.winfo_manager():
+            self.ms_summary.grid(row=0, column=1, sticky="nsew", padx=(10, 0))
 
     def _handle_ms_authority_change(self, *_):
         value = (self.ms_authority_var.get() or "organizations").strip() or "organizations"
         if hasattr(self, "settings"):
             self.settings["ms_authority"] = value
+        # Tcl may run this trace before the dirty-key trace on the same variable.
+        self._dirty_keys.add("ms_authority")
         self.update_current_settings_display()
 
     def _show_error_with_copy(self, title: str, message: str) -> None:
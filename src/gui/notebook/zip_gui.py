@@ -9,6 +9,7 @@ import traceback
 from src.backend.workflow import prep_invoice_zips, scan_for_invoices
 from src.backend.db.db import get_client_list
 from src.backend.db.db_utility import db_mgmt
+from src.gui.utility import single_flight
 
 
 class ZipTab:
@@ -49,8 +50,8 @@ class ZipTab:
         self.preview_table.heading("zipfile", text="ZIP Name")
         self.preview_table.pack(fill="both", expand=True, pady=10)
 
+    @single_flight("generate_zip_button")
     def start_preview(self):
-        self.generate_zip_button.state(["disabled"])
         self.preview_status_var.set("Generating ZIPs...")
         threading.Thread(target=self._preview_thread, daemon=True).start()
 
@@ -70,21 +71,12 @@ class ZipTab:
             period_str = f"{int(period_year)}-{int(period_month):02d}"
             agg = self.zip_agg_var.get()
             client_list = get_client_list(agg)
-            invoices_to_ship = scan_for_invoices(
-                client_list,
-                period_year,
-                period_month,
-                agg,
-            )
+            invoices_to_ship = scan_for_invoices(client_list, period_year, period_month, agg)
             email_shipment = prep_invoice_zips(invoices_to_ship, workflow_kwargs.get("zip_output_dir"), agg=agg)
-            rows = [
-                (
-                    shipment.get("head_office_name") or Path(shipment["zip_path"]).stem,
-                    period_str,
-                    Path(shipment["zip_path"]).name,
-                )
-                for shipment in email_shipment
-            ]
+            rows = []
+            for shipment in email_shipment:
+                zip_path = Path(shipment["zip_path"])
+                rows.append((shipment.get("head_office_name") or zip_path.stem, period_str, zip_path.name))
             self.email_shipment = email_shipment
             if skipped:
                 status_message = "ZIP generation complete. ⚠ Files skipped:\n" + "\n".join(f"  • {w}" for w in skipped)
@@ -97,10 +89,14 @@ class ZipTab:
             self.root.after(0, lambda e=err, tb=err_trace: self._on_preview_error(e, tb))
 
     def update_preview_table(self, rows):
-        for row in self.preview_table.get_children():
-            self.preview_table.delete(row)
+        table = self.preview_table
+        children = table.get_children()
+        if children:
+            table.delete(*children)
+        # Call the Tcl command directly; Treeview.insert's option formatting dominates at hundreds of rows.
+        call, widget = table.tk.call, str(table)
         for r in rows:
-            self.preview_table.insert("", "end", values=r)
+            call(widget, "insert", "", "end", "-values", r)
 
     def _on_preview_complete(self, status_message: str, rows: list[tuple]):
         self.preview_status_var.set(status_message)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
+import threading
 from datetime import datetime
-from typing import Any, Dict, Mapping
+from typing import Any, Callable, Dict, Hashable, Iterable, Mapping
 
 from src.backend.config import SecureConfig
 
@@ -14,8 +16,14 @@ DEFAULT_BODY_TEMPLATE = (
 )
 DEFAULT_SENDER_NAME = "Billing Department"
 REPORTER_EMAILS_PLACEHOLDER = []
-DEFAULT_PERIOD_MONTH = datetime.now().month - 1 or 12
-DEFAULT_PERIOD_YEAR = datetime.now().year if DEFAULT_PERIOD_MONTH != 12 else datetime.now().year - 1
+# Read the clock once so month and year agree even across a month boundary.
+_now = datetime.now()
+DEFAULT_PERIOD_MONTH = _now.month - 1 or 12
+DEFAULT_PERIOD_YEAR = _now.year if _now.month != 1 else _now.year - 1
+_DEFAULT_MONTH_YEAR = {
+    "email_month": DEFAULT_PERIOD_MONTH,
+    "email_year": DEFAULT_PERIOD_YEAR,
+}
 
 # Default values used when no encrypted config is present.
 DEFAULT_SETTINGS: Dict[str, Any] = {
@@ -41,11 +49,9 @@ def load_settings(secure_config: SecureConfig) -> Dict[str, Any]:
     """
     Load config from SecureConfig with defaults filled in.
     """
-    data = secure_config.load()
-    merged = DEFAULT_SETTINGS.copy()
-    for key, value in (data or {}).items():
-        if key in merged:
-            merged[key] = value
+    data = secure_config.load() or {}
+    # Only known keys are taken from storage; everything else falls back to defaults.
+    merged = {key: data.get(key, default) for key, default in DEFAULT_SETTINGS.items()}
     # Guard against persisted empty strings for email templates.
     merged["subject_template"] = merged.get("subject_template") or DEFAULT_SUBJECT_TEMPLATE
     merged["body_template"] = merged.get("body_template") or DEFAULT_BODY_TEMPLATE
@@ -57,14 +63,10 @@ def persist_settings(secure_config: SecureConfig, settings: Mapping[str, Any]) -
     Persist the settings dict via SecureConfig.
     Merge into existing secure config so MSAL token cache and other extras survive.
     """
-    existing = secure_config.load() or {}
-    merged = dict(existing)
+    # load() hands back a private copy, so it can be updated in place.
+    merged = secure_config.load() or {}
     # Avoid overwriting the MSAL token cache (managed by MSalDeviceCodeTokenProvider)
-    filtered_settings = {
-        key: value for key, value in dict(settings).items()
-        if key != "ms_token_cache"
-    }
-    merged.update(filtered_settings)
+    merged.update((key, value) for key, value in settings.items() if key != "ms_token_cache")
     secure_config.save(merged)
 
 
@@ -72,24 +74,93 @@ def apply_settings_to_vars(vars_map: Mapping[str, Any], settings: Mapping[str, A
     """
     Set Tkinter Variable instances from a settings dict.
     """
+    settings_get = settings.get
+    defaults_get = DEFAULT_SETTINGS.get
     for key, var in vars_map.items():
-        var.set(settings.get(key, DEFAULT_SETTINGS.get(key, "")))
+        var.set(settings_get(key, defaults_get(key, "")))
 
 def reset_month_and_year():
-    RESET_MONTH_AND_YEAR = {
-        "email_month": DEFAULT_PERIOD_MONTH,
-        "email_year": DEFAULT_PERIOD_YEAR,
-    }
-    return RESET_MONTH_AND_YEAR
+    return _DEFAULT_MONTH_YEAR.copy()
+
+def _tcl_quote(value: str) -> str:
+    """Quote a string as a Tcl word, escaping characters that trigger substitution."""
+    escaped = (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("$", "\\$")
+        .replace("[", "\\[")
+        .replace("]", "\\]")
+    )
+    return f'"{escaped}"'
+
 
-def settings_from_vars(vars_map: Mapping[str, Any]) -> Dict[str, Any]:
+def tcl_set_script(values: Mapping[str, str]) -> str:
+    """
+    Build one Tcl script that assigns every global variable in ``values``.
+
+    Evaluating the script with ``tk.eval`` updates all variables in a single
+    Python -> Tcl call instead of one ``Variable.set`` round trip each.
+    """
+    return "\n".join(f"set ::{name} {_tcl_quote(str(value))}" for name, value in values.items())
+
+
+def settings_from_vars(
+    vars_map: Mapping[str, Any],
+    keys: Iterable[str] | None = None,
+) -> Dict[str, Any]:
     """
     Read values from Tkinter Variable instances into a settings dict.
+    Pass ``keys`` to read only those entries (e.g. the ones changed since the last read).
     """
-    settings: Dict[str, Any] = {}
-    for key, var in vars_map.items():
-        value = var.get()
-        if isinstance(value, str):
-            value = value.strip()
-        settings[key] = value
-    return settings
+    return {
+        key: value.strip() if isinstance(value := vars_map[key].get(), str) else value
+        for key in (vars_map if keys is None else keys)
+    }
+
+def single_flight(button_attr: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorate a button command so at most one run is in flight.
+
+    The ttk button named by ``button_attr`` is disabled before the handler body
+    runs, and calls arriving while it is disabled return immediately. The
+    handler's completion/error callback is responsible for re-enabling it.
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            button = getattr(self, button_attr)
+            if button.instate(["disabled"]):
+                return None
+            button.state(["disabled"])
+            return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class ClientPool:
+    """
+    Thread-safe cache of long-lived clients keyed by their connection settings.
+
+    Worker threads may send concurrently, so lookups and creation happen under a
+    lock; each key's client is built at most once until the pool is cleared.
+    """
+
+    def __init__(self) -> None:
+        self._clients: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = factory()
+                self._clients[key] = client
+            return client
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+
+
+# Shared by every tab that sends mail so a session reuses one client per account.
+EMAIL_CLIENT_POOL = ClientPool()
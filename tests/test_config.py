@@ -27,6 +27,25 @@ def test_secure_config_round_trip_with_generated_key(monkeypatch, tmp_path):
     assert reloaded == payload
 
 
+def test_secure_config_load_reuses_cache_after_save(monkeypatch, tmp_path):
+    monkeypatch.setenv("APP_ENV", "development")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config.SecureConfig, "_get_keyring", lambda self: None)
+
+    secure_config = config.SecureConfig()
+    secure_config.save({"mode": "Test"})
+
+    def fail_disk_read():
+        raise AssertionError("load() should be served from the cache")
+
+    monkeypatch.setattr(secure_config, "_load_from_disk", fail_disk_read)
+
+    loaded = secure_config.load()
+    loaded["mode"] = "Active"
+
+    assert secure_config.load() == {"mode": "Test"}
+
+
 def test_get_date_regex_matches_common_formats():
     patterns = config.get_date_regex()
     samples = ["2024-05-01", "5/1/2024", "Feb 3, 2024", "03 Mar 2024"]
@@ -35,6 +54,14 @@ def test_get_date_regex_matches_common_formats():
         assert any(p.search(sample) for p in patterns)
 
 
+def test_get_date_formats_align_with_date_regex(monkeypatch):
+    assert len(config.get_date_formats()) == len(config.get_date_regex())
+
+    monkeypatch.setattr(config, "date_formats", [("%Y-%m-%d",)])
+    assert config.get_date_formats()[0] == ("%Y-%m-%d",)
+    assert config.get_date_formats()[1:] == [()] * (len(config.date_patterns) - 1)
+
+
 def test_get_file_regex_handles_invoice_and_default():
     invoice_regex = config.get_file_regex("invoice")
     match = invoice_regex.match("ACME invoice INV-001 SAFE MARINE.pdf")
@@ -48,3 +75,7 @@ def test_get_file_regex_handles_invoice_and_default():
     default_regex = config.get_file_regex()
     assert default_regex.match("example.pdf")
     assert not default_regex.match("example.txt")
+
+
+def test_get_file_regex_returns_cached_pattern():
+    assert config.get_file_regex("invoice") is config.get_file_regex("invoice")
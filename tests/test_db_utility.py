@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pytest
+
+import src.backend.db.db as db_module
+import src.backend.db.db_utility as db_utility
+
+
+@pytest.fixture
+def temp_db(monkeypatch, tmp_path):
+    """Point get_db_path() at a temporary SQLite file and create the schema."""
+    monkeypatch.setenv("APP_DB_PATH", str(tmp_path / "invoice_mailer.sqlite3"))
+    db_module.init_db()
+
+
+def test_scan_invoices_db_walks_nested_folders_case_insensitively(monkeypatch, tmp_path, temp_db):
+    invoice_folder = tmp_path / "invoices"
+    nested = invoice_folder / "2026" / "September"
+    nested.mkdir(parents=True)
+    (invoice_folder / "ACME INVOICE INV-001 SAFE MARINE.PDF").write_bytes(b"")
+    (nested / "BETA invoice INV-002 SEA STAR.pdf").write_bytes(b"")
+    (nested / "BETA statement.pdf").write_bytes(b"")
+    (nested / "notes invoice.txt").write_bytes(b"")
+    for skipped_dir in (".git", "node_modules"):
+        (invoice_folder / skipped_dir).mkdir()
+        (invoice_folder / skipped_dir / "ACME invoice INV-999 SAFE MARINE.pdf").write_bytes(b"")
+    monkeypatch.setattr(db_utility, "extract_pdf_dates", lambda paths, field: dict.fromkeys(paths, "2026-09-15"))
+
+    skipped = db_utility.scan_invoices_db(invoice_folder)
+
+    rows = db_module.get_invoices(period_month="2026-09")
+    assert skipped == []
+    assert sorted(row["tax_invoice_no"] for row in rows) == ["INV-001", "INV-002"]
+    assert {row["inv_file_path"] for row in rows} == {
+        (invoice_folder / "ACME INVOICE INV-001 SAFE MARINE.PDF").as_posix(),
+        (nested / "BETA invoice INV-002 SEA STAR.pdf").as_posix(),
+    }
+
+
+def test_scan_invoices_db_reuses_dates_for_unchanged_files(monkeypatch, tmp_path, temp_db):
+    invoice_folder = tmp_path / "invoices"
+    invoice_folder.mkdir()
+    pdf = invoice_folder / "ACME invoice INV-001 SAFE MARINE.pdf"
+    pdf.write_bytes(b"v1")
+
+    extracted = []
+
+    def fake_extract(paths, field):
+        extracted.extend(paths)
+        return dict.fromkeys(paths, "2026-09-15")
+
+    monkeypatch.setattr(db_utility, "extract_pdf_dates", fake_extract)
+
+    db_utility.scan_invoices_db(invoice_folder)
+    db_utility.scan_invoices_db(invoice_folder)
+    assert len(extracted) == 1
+
+    pdf.write_bytes(b"version two")
+    db_utility.scan_invoices_db(invoice_folder)
+    assert len(extracted) == 2
+
+
+def test_record_invoice_uses_caller_transaction(temp_db):
+    with db_module.get_conn() as conn:
+        db_module.record_invoice("INV-001", "ACME123", "SAFE MARINE", "/inv/1.pdf", "2026-09-15", "2026-09", conn=conn)
+        db_module.record_invoice("INV-002", "ACME123", "SAFE MARINE", "/inv/2.pdf", "2026-09-16", "2026-09", conn=conn)
+        assert db_module.get_invoices() == []  # separate connection; not committed yet
+
+    assert len(db_module.get_invoices(customer_number="ACME123")) == 2
+
+
+def test_db_mgmt_skips_rebuild_when_sources_are_unchanged(monkeypatch, tmp_path, temp_db):
+    client_file = tmp_path / "clients.xlsx"
+    client_file.write_bytes(b"xlsx")
+    invoice_folder = tmp_path / "invoices"
+    soa_folder = tmp_path / "soa"
+    invoice_folder.mkdir()
+    soa_folder.mkdir()
+    pdf = invoice_folder / "ACME invoice INV-001 SAFE MARINE.pdf"
+    pdf.write_bytes(b"v1")
+
+    rebuilds = []
+    monkeypatch.setattr(db_utility, "_last_rebuild", None)
+    monkeypatch.setattr(db_utility, "scan_clients_and_soa", lambda *args: rebuilds.append(args) or ["warn"])
+    monkeypatch.setattr(db_utility, "scan_invoices_db", lambda *args: [])
+
+    assert db_utility.db_mgmt(client_file, invoice_folder, soa_folder) == ["warn"]
+    assert db_utility.db_mgmt(client_file, invoice_folder, soa_folder) == ["warn"]
+    assert len(rebuilds) == 1
+
+    pdf.write_bytes(b"version two")
+    db_utility.db_mgmt(client_file, invoice_folder, soa_folder)
+    assert len(rebuilds) == 2
+
@@ -54,3 +54,86 @@ def test_build_email_dedupes_and_strips_recipients(tmp_path):
         "alice@example.com",
         "bob@example.com",
     ]
+
+
+class RecordingClient:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, **kwargs):
+        self.sent.append(kwargs["to"])
+
+
+def test_send_all_emails_concurrent_keeps_batch_order(tmp_path):
+    batches = [
+        email_util.ClientBatch(
+            zip_path=tmp_path / f"{idx}.zip",
+            email_list=[f"client{idx}@example.com"],
+            head_office_name=f"Client {idx}",
+        )
+        for idx in range(6)
+    ]
+    for batch in batches:
+        batch.zip_path.write_bytes(b"PK")
+    client = RecordingClient()
+    progress = []
+
+    log = email_util.send_all_emails(
+        batches,
+        ms_email_address="from@example.com",
+        email_client=client,
+        concurrency=3,
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+
+    assert client.sent[0] == ["client0@example.com"]
+    assert sorted(client.sent) == [[f"client{idx}@example.com"] for idx in range(6)]
+    positions = [log.index(f"client{idx}@example.com") for idx in range(6)]
+    assert positions == sorted(positions)
+    assert progress == [(done, 6) for done in range(1, 7)]
+
+
+def test_send_all_emails_skips_missing_or_empty_attachments(tmp_path):
+    good, empty, missing = (tmp_path / name for name in ("good.zip", "empty.zip", "missing.zip"))
+    good.write_bytes(b"PK")
+    empty.write_bytes(b"")
+    batches = [
+        email_util.ClientBatch(zip_path=path, email_list=[f"{path.stem}@example.com"], head_office_name=path.stem)
+        for path in (good, empty, missing)
+    ]
+    client = RecordingClient()
+
+    log = email_util.send_all_emails(batches, ms_email_address="from@example.com", email_client=client)
+
+    assert client.sent == [["good@example.com"]]
+    assert "FAILED to send to empty@example.com" in log
+    assert "Attachment is empty" in log
+    assert "FAILED to send to missing@example.com" in log
+
+
+def test_normalize_recipients_splits_dedupes_and_drops_invalid():
+    recipients = email_util.normalize_recipients(
+        [" alice@example.com; bob@example.com , alice@example.com ", None, "bob@example.com;;not-an-email"]
+    )
+
+    assert recipients == ["alice@example.com", "bob@example.com"]
+
+
+def test_send_all_emails_dry_run_renders_templates_per_batch(tmp_path):
+    batches = [
+        email_util.ClientBatch(zip_path=tmp_path / f"{name}.zip", email_list=["a@example.com"], head_office_name=name)
+        for name in ("ACME", "Beta")
+    ]
+
+    log = email_util.send_all_emails(
+        batches,
+        dry_run=True,
+        subject_template="Invoices for {head_office_name} ${month}/${year}",
+        body_template="Dear ${head_office_name},\\nRegards, {sender_name}",
+        sender_name="Billing",
+        period="2024-05",
+    )
+
+    assert "Subject: Invoices for ACME 05/2024" in log
+    assert "Subject: Invoices for Beta 05/2024" in log
+    assert "Dear Beta,\nRegards, Billing" in log
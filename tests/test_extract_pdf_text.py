@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import fitz
+
+import src.backend.utility.extract_pdf_text as pdf_text
+
+
+def test_module_import_defers_pymupdf_and_dateutil():
+    code = (
+        "import sys; import src.backend.utility.extract_pdf_text; "
+        "assert 'fitz' not in sys.modules and 'dateutil.parser' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).resolve().parents[1])
+
+
+def test_find_date_strings_keeps_pattern_priority_order():
+    text = "Due 03 Mar 2024, issued 5/1/2024 (ref 2024-05-01) Feb 3, 2024"
+
+    assert pdf_text.find_date_strings(text) == [
+        "2024-05-01",
+        "5/1/2024",
+        "Feb 3, 2024",
+        "03 Mar 2024",
+    ]
+
+
+def test_find_date_strings_keeps_overlapping_matches_of_each_pattern():
+    assert pdf_text.find_date_strings("Date 12 Mar 15 2024") == ["Mar 15 2024", "12 Mar 15"]
+    assert pdf_text.find_date_strings("1/2/2024-05-01") == ["2024-05-01", "1/2/2024"]
+    assert pdf_text._normalize_first_match(pdf_text._date_matches("Date 12 Mar 15 2024")) == "2024-03-15"
+
+
+def test_find_date_strings_matches_separate_pattern_scans():
+    text = "Invoice date: 12/04/2024\\nPrinted 2024-04-15 and april 2, 2024"
+    expected = [m.group(0) for p in pdf_text.DATE_PATTERNS for m in p.finditer(text)]
+
+    assert pdf_text.find_date_strings(text) == expected
+    assert pdf_text.find_date_strings("") == []
+
+
+def _make_pdf(path, text: str) -> None:
+    doc = fitz.open()
+    page = doc.new_page(width=612, height=792)
+    # Baseline inside the inv_date box (x 1-12 %, y 32.75-34 % of the page).
+    page.insert_text((10, 0.3375 * 792), text, fontsize=7)
+    doc.save(path)
+    doc.close()
+
+
+def test_extract_dates_use_pattern_formats_before_dateutil(monkeypatch):
+    text = "Printed 2024/5/1, due 15/04/2024 or Sept 5, 2024"
+
+    assert pdf_text._normalize_first_match(pdf_text._date_matches(text)) == "2024-05-01"
+    assert pdf_text._normalize_first_match(pdf_text._date_matches("due 05-04-24")) == "2024-04-05"
+    assert pdf_text._normalize_first_match(pdf_text._date_matches("3 MARCH\n2024")) == "2024-03-03"
+
+    # "Sept" has no strptime form, so dateutil handles it.
+    calls = []
+    real_normalize = pdf_text.normalize_first_date
+    monkeypatch.setattr(pdf_text, "normalize_first_date", lambda dates: calls.append(dates) or real_normalize(dates))
+    assert pdf_text._normalize_first_match(pdf_text._date_matches("Sept 5, 2024")) == "2024-09-05"
+    assert calls == [["Sept 5, 2024"]]
+
+
+def test_dateutil_only_match_keeps_priority_over_later_matches():
+    for text, expected in [
+        ("Tue 3 Sept 2024 or 4 Oct 2024", "2024-09-03"),
+        ("Sept 5, 2024 then 03 Mar 2024", "2024-09-05"),
+        ("Sept 5, 2024 due 15/04/2024", "2024-04-15"),  # numeric pattern ranks first
+    ]:
+        assert pdf_text._normalize_first_match(pdf_text._date_matches(text)) == expected
+        assert pdf_text._normalize_first_match(pdf_text._date_matches(text)) == (
+            pdf_text.normalize_first_date(pdf_text.find_date_strings(text))
+        )
+
+
+def test_extract_pdf_dates_matches_serial_results_in_worker_processes(monkeypatch, tmp_path):
+    paths = []
+    for idx in range(3):
+        pdf_path = tmp_path / f"invoice-{idx}.pdf"
+        _make_pdf(pdf_path, f"1{idx}/04/2024")
+        paths.append(pdf_path)
+
+    serial = pdf_text.extract_pdf_dates(paths, "inv_date", max_workers=1)
+
+    monkeypatch.setattr(pdf_text, "_PROCESS_POOL_MIN_FILES", 2)
+    pooled = pdf_text.extract_pdf_dates(paths, "inv_date", max_workers=2)
+
+    assert pooled == serial == {
+        paths[0]: "2024-04-10",
+        paths[1]: "2024-04-11",
+        paths[2]: "2024-04-12",
+    }
+    assert pdf_text.extract_pdf_dates([], "inv_date") == {}
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import tkinter
+
 import src.gui.utility as gui_util
 
 
@@ -66,7 +68,81 @@ def test_apply_and_read_settings_from_vars():
     assert collected["mode"] == "Active"
 
 
+def test_settings_from_vars_reads_only_requested_keys():
+    vars_map = {"invoice_folder": DummyVar(" /inv "), "mode": DummyVar("Test")}
+
+    collected = gui_util.settings_from_vars(vars_map, keys={"invoice_folder"})
+
+    assert collected == {"invoice_folder": "/inv"}
+
+
 def test_reset_month_and_year_matches_defaults():
     result = gui_util.reset_month_and_year()
     assert result["email_month"] == gui_util.DEFAULT_PERIOD_MONTH
     assert result["email_year"] == gui_util.DEFAULT_PERIOD_YEAR
+
+
+def test_tcl_set_script_sets_values_verbatim():
+    interp = tkinter.Tcl()
+    values = {
+        "plain": "Mode: Active",
+        "special": 'C:\\inv {x} $HOME [exit] "quoted"; next\nline',
+    }
+
+    interp.eval(gui_util.tcl_set_script(values))
+
+    assert interp.getvar("plain") == values["plain"]
+    assert interp.getvar("special") == values["special"]
+
+
+def test_client_pool_builds_each_key_once():
+    pool = gui_util.ClientPool()
+    built = []
+
+    def factory():
+        built.append(object())
+        return built[-1]
+
+    first = pool.acquire(("a@example.com", "organizations"), factory)
+    again = pool.acquire(("a@example.com", "organizations"), factory)
+    other = pool.acquire(("b@example.com", "organizations"), factory)
+
+    assert first is again
+    assert other is not first
+    assert len(built) == 2
+
+    pool.clear()
+    assert pool.acquire(("a@example.com", "organizations"), factory) is not first
+
+
+class DummyButton:
+    def __init__(self):
+        self.disabled = False
+
+    def instate(self, spec):
+        return self.disabled if spec == ["disabled"] else not self.disabled
+
+    def state(self, spec):
+        self.disabled = spec == ["disabled"]
+
+
+def test_single_flight_ignores_calls_while_button_disabled():
+    class Tab:
+        def __init__(self):
+            self.run_button = DummyButton()
+            self.calls = 0
+
+        @gui_util.single_flight("run_button")
+        def start(self):
+            self.calls += 1
+
+    tab = Tab()
+    tab.start()
+    tab.start()
+
+    assert tab.calls == 1
+    assert tab.run_button.disabled
+
+    tab.run_button.state(["!disabled"])
+    tab.start()
+    assert tab.calls == 2
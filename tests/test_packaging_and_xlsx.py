@@ -48,3 +48,17 @@ def test_iter_xlsx_rows_as_dicts_yields_rows(tmp_path):
         {"Head Office": "ACME", "Customer Number": "123", "Email": "a@example.com"},
         {"Head Office": "Beta", "Customer Number": "456", "Email": "b@example.com"},
     ]
+
+
+def test_collect_files_to_zip_stores_pdfs_uncompressed(tmp_path):
+    pdf = tmp_path / "invoice.PDF"
+    notes = tmp_path / "notes.txt"
+    pdf.write_bytes(b"%PDF-1.7 " * 100)
+    notes.write_text("notes " * 100)
+
+    zip_path = collect_files_to_zip([pdf, notes], tmp_path / "out.zip")
+
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.getinfo("invoice.PDF").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("notes.txt").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.read("invoice.PDF") == pdf.read_bytes()
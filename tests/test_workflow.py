@@ -3,40 +3,49 @@ from __future__ import annotations
 import zipfile
 from pathlib import Path
 
+import pytest
+
+import src.backend.db.db as db_module
 import src.backend.workflow as workflow
 
 
 def test_scan_for_invoices_builds_per_client_results(monkeypatch):
     clients = ["CUST1", "CUST2"]
 
-    def fake_get_client(**kwargs):
-        val = kwargs.get("customer_number") or kwargs.get("head_office") or ""
-        return [{"head_office": f"HO-{val}"}]
+    def fake_get_clients(customer_numbers):
+        return [
+            {"customer_number": cust, "head_office": f"HO-{cust}"}
+            for cust in customer_numbers
+        ]
 
-    def fake_get_soa_by_head_office(head_office):
+    def fake_get_soa_by_head_offices(head_offices):
         return [
             {
+                "head_office": head_office,
                 "soa_file_path": f"/soa/{head_office}.pdf",
                 "head_office_name": f"{head_office} Name",
             }
+            for head_office in head_offices
         ]
 
-    def fake_get_invoices(**kwargs):
-        cust = kwargs.get("customer_number", "")
-        period = kwargs.get("period_month")
+    def fake_get_invoices_by(agg, values, period_months):
+        assert agg == "customer_number"
         return [
             {
+                "client_key": cust,
                 "tax_invoice_no": f"INV-{cust}-{period}",
                 "customer_number": cust,
                 "ship_name": "SHIP",
                 "invoice_date": f"{period}-01",
                 "inv_file_path": f"/invoices/{cust}.pdf",
             }
+            for period in period_months
+            for cust in values
         ]
 
-    monkeypatch.setattr(workflow, "get_client", fake_get_client)
-    monkeypatch.setattr(workflow, "get_soa_by_head_office", fake_get_soa_by_head_office)
-    monkeypatch.setattr(workflow, "get_invoices", fake_get_invoices)
+    monkeypatch.setattr(workflow, "get_clients", fake_get_clients)
+    monkeypatch.setattr(workflow, "get_soa_by_head_offices", fake_get_soa_by_head_offices)
+    monkeypatch.setattr(workflow, "get_invoices_by", fake_get_invoices_by)
 
     result = workflow.scan_for_invoices(clients, 2024, 5, "customer_number")
 
@@ -55,6 +64,46 @@ def test_scan_for_invoices_builds_per_client_results(monkeypatch):
     }
 
 
+@pytest.mark.parametrize(
+    ("agg", "client", "expected_numbers"),
+    [
+        ("customer_number", "C1", ["INV-1", "INV-3", "INV-2"]),
+        ("head_office", "HO1", ["INV-1", "INV-3", "INV-4", "INV-2"]),
+        ("ship_name", "SEA STAR", ["INV-1", "INV-4", "INV-2"]),
+    ],
+)
+def test_scan_for_invoices_batched_queries_match_per_client_lookup(
+    monkeypatch, tmp_path, agg, client, expected_numbers
+):
+    monkeypatch.setenv("APP_DB_PATH", str(tmp_path / "invoice_mailer.sqlite3"))
+    db_module.init_db()
+    db_module.add_or_update_client("HO1", "C1", ["a@example.com"])
+    db_module.add_or_update_client("HO1", "C2", ["b@example.com"])
+    db_module.add_or_update_client("HO2", "C3", ["c@example.com"])
+    db_module.add_or_update_soa("HO1", "Head Office One", "/soa/ho1.pdf")
+    for number, cust, ship, period in [
+        ("INV-1", "C1", "SEA STAR", "2024-05"),
+        ("INV-2", "C1", "SEA STAR", "2024-06"),
+        ("INV-3", "C1", "OTHER", "2024-05"),
+        ("INV-4", "C2", "SEA STAR", "2024-05"),
+        ("INV-5", "C3", "SEA STAR", "2024-07"),
+        ("INV-6", "C3", "THIRD", "2024-05"),
+    ]:
+        db_module.record_invoice(number, cust, ship, f"/inv/{number}.pdf", f"{period}-01", period)
+
+    result = workflow.scan_for_invoices([client, "unmatched"] if agg == "ship_name" else [client], 2024, 5, agg)
+
+    entries = result[client]
+    assert [entry["invoice_number"] for entry in entries] == expected_numbers
+    assert {entry["soa_path"] for entry in entries} == {"/soa/ho1.pdf"}
+    assert {entry["head_office_name"] for entry in entries} == {"Head Office One"}
+    if agg == "ship_name":
+        assert result["unmatched"] == []
+    else:
+        with pytest.raises(ValueError, match="Client not found"):
+            workflow.scan_for_invoices([client, "missing"], 2024, 5, agg)
+
+
 def test_prep_invoice_zips_creates_archives_and_email_payload(tmp_path, monkeypatch):
     inv1 = tmp_path / "one.pdf"
     inv2 = tmp_path / "two.pdf"
@@ -99,3 +148,40 @@ def test_prep_invoice_zips_creates_archives_and_email_payload(tmp_path, monkeypa
     with zipfile.ZipFile(zip_path) as zf:
         names = set(zf.namelist())
     assert names == {"one.pdf", "two.pdf", "soa.pdf"}
+
+
+def test_prep_invoice_zips_keeps_client_order_and_collision_suffixes(tmp_path, monkeypatch):
+    invoices_to_ship = {}
+    for client_key in ("A/B", "A_B", "Zulu", "Alpha"):
+        pdf = tmp_path / f"{client_key.replace('/', '-')}.pdf"
+        pdf.write_text(client_key)
+        invoices_to_ship[client_key] = [{"head_office_name": client_key, "invoice_path": pdf}]
+
+    monkeypatch.setattr(workflow, "get_client_email", lambda head_office=None: [f"{head_office}@example.com"])
+
+    shipments = workflow.prep_invoice_zips(invoices_to_ship, zip_output_dir=tmp_path / "zips")
+
+    assert [s["zip_path"].name for s in shipments] == ["A_B.zip", "A_B_2.zip", "Zulu.zip", "Alpha.zip"]
+    assert [s["email_list"] for s in shipments] == [[f"{key}@example.com"] for key in invoices_to_ship]
+    assert all(s["zip_path"].exists() for s in shipments)
+
+
+def test_prep_invoice_zips_looks_up_shared_customer_emails_once(tmp_path, monkeypatch):
+    invoices_to_ship = {}
+    for ship in ("SEA STAR", "SAFE MARINE"):
+        pdf = tmp_path / f"{ship}.pdf"
+        pdf.write_text(ship)
+        invoices_to_ship[ship] = [{"head_office_name": "ACME", "invoice_path": pdf, "customer_number": "ACME123"}]
+
+    lookups = []
+
+    def fake_get_client_email(customer_number=None):
+        lookups.append(customer_number)
+        return ["billing@example.com"]
+
+    monkeypatch.setattr(workflow, "get_client_email", fake_get_client_email)
+
+    shipments = workflow.prep_invoice_zips(invoices_to_ship, zip_output_dir=tmp_path / "zips", agg="ship_name")
+
+    assert lookups == ["ACME123"]
+    assert [s["email_list"] for s in shipments] == [["billing@example.com"], ["billing@example.com"]]